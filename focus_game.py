@@ -75,6 +75,8 @@ class FocusGame:
     BOARD_SIZE = 8              # set by game rules; should not be changed
     INVALID_SPACE = "*"
     VALID_SPACE = " "
+    MAX_STACK_HEIGHT = 5
+    TALL_STACK_HEIGHT = 4       # stacks at or above this height are at most one piece from full
 
     def __init__(self, players):
         """
@@ -115,6 +117,7 @@ class FocusGame:
         self._num_players = len(self._players.keys())
         self._num_active_players = len(self._players.keys())
         self._board = None
+        self._features = None       # per-color evaluation tallies; see show_features
 
         self.reset_board()
 
@@ -208,6 +211,13 @@ class FocusGame:
                         else:
                             self._board[i][j].append(selected_colors[0])
 
+        # tally evaluation features from scratch for the new board
+        self._features = {color: {"controlled": 0, "buried": 0, "tall": 0, "controlled_height": 0}
+                          for color in self.VALID_COLORS}
+        for row in self._board:
+            for stack in row:
+                self.add_stack_features(stack)
+
         # reset player's active status, captured, and reserve pieces
         # for three players, each player gets an extra starting reserve piece
         for key in self._players.keys():
@@ -286,13 +296,15 @@ class FocusGame:
         """
         if self.validate_reserved_move(player_index, to_tuple):
             # valid move; update board, check for victory, and toggle next turn
+            self.remove_stack_features(self._board[to_tuple[0]][to_tuple[1]])
             self._board[to_tuple[0]][to_tuple[1]].append(self._players.get(player_index).get_color())
             # decrement player's reserve count
             self._players.get(player_index).inc_reserve(-1)
             # check if added piece has made the stack too large and update accordingly
-            if len(self._board[to_tuple[0]][to_tuple[1]]) > 5:
+            if len(self._board[to_tuple[0]][to_tuple[1]]) > self.MAX_STACK_HEIGHT:
                 self.capture_or_reserve(player_index, self._board[to_tuple[0]][to_tuple[1]][0])
                 self._board[to_tuple[0]][to_tuple[1]].pop(0)
+            self.add_stack_features(self._board[to_tuple[0]][to_tuple[1]])
 
             # check for domination
             for i in range(self._num_players):
@@ -391,7 +403,7 @@ class FocusGame:
         :return: True if valid; else False
         """
         # check that num_pieces is valid
-        if not isinstance(num_pieces, int) or num_pieces <= 0 or num_pieces > 5:
+        if not isinstance(num_pieces, int) or num_pieces <= 0 or num_pieces > self.MAX_STACK_HEIGHT:
             return False
         # check that there are enough pieces to move
         elif len(self._board[from_tuple[0]][from_tuple[1]]) < num_pieces:
@@ -412,15 +424,63 @@ class FocusGame:
         :return: None
         """
         from_stack = self._board[from_tuple[0]][from_tuple[1]]
+        # take both stacks out of the feature tallies before changing them
+        self.remove_stack_features(from_stack)
+        self.remove_stack_features(self._board[to_tuple[0]][to_tuple[1]])
         # remove the top num_pieces off from_stack
         self._board[from_tuple[0]][from_tuple[1]] = from_stack[:-num_pieces]
         # add the top num_pieces to top of to_stack
         self._board[to_tuple[0]][to_tuple[1]] += from_stack[-num_pieces:]
-        # check that to_tuple location doesn't have more than 5 pieces
-        # if it does, remove bottom piece until only 5 remain
-        while len(self._board[to_tuple[0]][to_tuple[1]]) > 5:
+        # check that to_tuple location doesn't have more than MAX_STACK_HEIGHT pieces
+        # if it does, remove bottom piece until only MAX_STACK_HEIGHT remain
+        while len(self._board[to_tuple[0]][to_tuple[1]]) > self.MAX_STACK_HEIGHT:
             self.capture_or_reserve(player_index, self._board[to_tuple[0]][to_tuple[1]][0])
             self._board[to_tuple[0]][to_tuple[1]].pop(0)
+        # add the updated stacks back into the feature tallies
+        self.add_stack_features(self._board[from_tuple[0]][from_tuple[1]])
+        self.add_stack_features(self._board[to_tuple[0]][to_tuple[1]])
+
+    def add_stack_features(self, stack):
+        """
+        Adds a stack's contribution to the per-color evaluation features.
+        :param stack: The stack list to add to the tallies.
+        :return: None
+        """
+        self.tally_stack_features(stack, 1)
+
+    def remove_stack_features(self, stack):
+        """
+        Removes a stack's contribution from the per-color evaluation features.
+        :param stack: The stack list to remove from the tallies.
+        :return: None
+        """
+        self.tally_stack_features(stack, -1)
+
+    def tally_stack_features(self, stack, sign):
+        """
+        Helper function that adds (sign = 1) or subtracts (sign = -1) a single stack's contribution to the
+        per-color evaluation features. Stacks hold at most MAX_STACK_HEIGHT pieces, so this is constant time.
+        -controlled: stacks with the color on top
+        -buried: pieces of the color beneath the top of a stack
+        -tall: controlled stacks of at least TALL_STACK_HEIGHT pieces (at most one piece from full)
+        -controlled_height: sum of the heights of controlled stacks, counting every piece including placeholders
+        :param stack: The stack list to tally.
+        :param sign: 1 to add the stack; -1 to remove it.
+        :return: None
+        """
+        if not stack:
+            return
+        # buried pieces; colors are compared upper-cased since reserve pieces use the player's color as given
+        # placeholder spaces are not colors and are skipped
+        for piece in stack[:-1]:
+            if piece.upper() in self._features:
+                self._features[piece.upper()]["buried"] += sign
+        top = stack[-1].upper()
+        if top in self._features:
+            self._features[top]["controlled"] += sign
+            self._features[top]["controlled_height"] += sign * len(stack)
+            if len(stack) >= self.TALL_STACK_HEIGHT:
+                self._features[top]["tall"] += sign
 
     def capture_or_reserve(self, player_index, piece):
         """
@@ -455,22 +515,20 @@ class FocusGame:
         :param player_index: The index/key of the player to check for loss.
         :return: True if domination loss exists; else False
         """
-        for row in self._board:
-            for piece in row:
-                # there exists at least one piece that belongs to player
-                if len(piece) > 0 and piece[-1] == self._players.get(player_index).get_color():
-                    return False
+        # there exists at least one stack that belongs to player
+        if self._features[self._players.get(player_index).get_color().upper()]["controlled"] > 0:
+            return False
         return True
 
     def show_pieces(self, from_tuple):
         """
         Displays the pieces located at from_tuple in a list format, starting with the bottom-most piece.
         :param from_tuple: The tuple representing the location to show pieces at.
-        :return: a list representation of the pieces at from_tuple
+        :return: a copy of the list of pieces at from_tuple, so callers cannot change the board directly
         """
         if isinstance(from_tuple, tuple) and isinstance(from_tuple[0], int) and isinstance(from_tuple[1], int) \
             and 0 <= from_tuple[0] < self.BOARD_SIZE and 0 <= from_tuple[1] < self.BOARD_SIZE:
-            return self._board[from_tuple[0]][from_tuple[1]]
+            return list(self._board[from_tuple[0]][from_tuple[1]])
         return None
 
     def show_reserve(self, player_index):
@@ -493,6 +551,18 @@ class FocusGame:
             return self._players.get(player_index).get_captured()
         return None
 
+    def show_features(self, player_index):
+        """
+        Shows the running evaluation features for the player's color. The features are updated as moves
+        are applied, so no board scan is needed.
+        :param player_index: The index/key of the player.
+        :return: A dict with the number of "controlled" stacks, "buried" pieces, "tall" controlled stacks,
+        and "controlled_height" (sum of controlled stack heights) for the player.
+        """
+        if self._players.get(player_index):
+            return dict(self._features[self._players.get(player_index).get_color().upper()])
+        return None
+
     def display_board(self):
         """
         Optional test method that visualizes the current board state.
@@ -516,10 +586,13 @@ class FocusGame:
         Test method that sets stack at a given location. Used for testing victory conditions
         of a board without playing a million moves.
         :param to_tuple: The tuple representing the location to change stack of.
-        :param stack_list: The stack list to replace at the to_tuple location.
+        :param stack_list: The stack list to replace at the to_tuple location. A copy is stored, so later
+        changes to stack_list do not affect the board.
         :return: None
         """
-        self._board[to_tuple[0]][to_tuple[1]] = stack_list
+        self.remove_stack_features(self._board[to_tuple[0]][to_tuple[1]])
+        self._board[to_tuple[0]][to_tuple[1]] = list(stack_list)
+        self.add_stack_features(self._board[to_tuple[0]][to_tuple[1]])
 
     def play_game(self):
         """
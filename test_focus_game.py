@@ -0,0 +1,117 @@
+# Description: Tests that the running evaluation features kept by FocusGame match a full scan of the board.
+
+import random
+import unittest
+
+from focus_game import FocusGame
+
+
+class TestFocusGameFeatures(unittest.TestCase):
+    """
+    Compares show_features against a from-scratch count of the board after moves are applied.
+    """
+
+    def setUp(self):
+        self.game = FocusGame([("Tim", "R"), ("Kyle", "G")])
+        self.game._current_turn = 0
+
+    def scan_features(self, player_index):
+        """
+        Counts the features for a player by scanning every stack on the board.
+        :param player_index: The index/key of the player.
+        :return: A dict with the same keys as show_features.
+        """
+        color = self.game._players.get(player_index).get_color().upper()
+        features = {"controlled": 0, "buried": 0, "tall": 0, "controlled_height": 0}
+        for row in self.game._board:
+            for stack in row:
+                features["buried"] += [piece.upper() for piece in stack[:-1]].count(color)
+                if stack and stack[-1].upper() == color:
+                    features["controlled"] += 1
+                    features["controlled_height"] += len(stack)
+                    if len(stack) >= self.game.TALL_STACK_HEIGHT:
+                        features["tall"] += 1
+        return features
+
+    def assert_features_match(self):
+        for player_index in self.game._players.keys():
+            self.assertEqual(self.game.show_features(player_index), self.scan_features(player_index))
+
+    def test_initial_board(self):
+        self.assert_features_match()
+
+    def test_set_stack(self):
+        self.game.set_stack((3, 3), ["G", "R", "G", "R"])
+        self.assert_features_match()
+        self.assertEqual(self.game.show_features(0)["tall"], 1)
+
+    def test_set_stack_copies_list(self):
+        stack = ["R", "R"]
+        self.game.set_stack((3, 3), stack)
+        stack.append("G")
+        self.assertEqual(self.game.show_pieces((3, 3)), ["R", "R"])
+        self.game.show_pieces((3, 3)).append("G")
+        self.assertEqual(self.game.show_pieces((3, 3)), ["R", "R"])
+        self.assert_features_match()
+
+    def test_move_empties_square(self):
+        self.game.set_stack((3, 3), ["R"])
+        self.game.move_piece(0, (3, 3), (3, 4), 1)
+        self.assertEqual(self.game.show_pieces((3, 3)), [])
+        self.assert_features_match()
+
+    def test_move_overflows_stack(self):
+        self.game.set_stack((3, 3), ["G", "R", "R"])
+        self.game.set_stack((3, 5), ["R", "G", "G", "R", "G"])
+        self.game.move_piece(0, (3, 3), (3, 5), 2)
+        self.assertEqual(self.game.show_pieces((3, 5)), ["G", "R", "G", "R", "R"])
+        self.assertEqual(self.game.show_reserve(0), 1)
+        self.assertEqual(self.game.show_captured(0), 1)
+        self.assert_features_match()
+
+    def test_reserved_move_onto_full_stack(self):
+        self.game._players.get(0).set_reserve(1)
+        self.game.set_stack((4, 4), ["G", "G", "R", "G", "G"])
+        self.game.reserved_move(0, (4, 4))
+        self.assertEqual(self.game.show_pieces((4, 4)), ["G", "R", "G", "G", "R"])
+        self.assertEqual(self.game.show_captured(0), 1)
+        self.assert_features_match()
+
+    def test_lowercase_colors(self):
+        self.game = FocusGame([("Tim", "r"), ("Kyle", "g")])
+        self.game._current_turn = 0
+        self.assertEqual(self.game.show_features(0)["controlled"], 18)
+        self.game._players.get(0).set_reserve(1)
+        self.game.reserved_move(0, (3, 3))
+        self.assertEqual(self.game.show_pieces((3, 3))[-1], "r")
+        self.assert_features_match()
+        self.assertFalse(self.game.check_domination_loss(0))
+        self.assertFalse(self.game.check_domination_loss(1))
+
+    def test_random_games(self):
+        rng = random.Random(0)
+        for num_players in range(FocusGame.MIN_PLAYERS, FocusGame.MAX_PLAYERS + 1):
+            players = [("Tim", "R"), ("Kyle", "G"), ("Benny", "Y"), ("Kenny", "B")][:num_players]
+            self.game = FocusGame(players)
+            self.game._current_turn = 0
+            for _ in range(5000):
+                player_index = self.game._current_turn
+                if player_index is None:
+                    break
+                if self.game.show_reserve(player_index) and rng.random() < 0.3:
+                    self.game.reserved_move(player_index, (rng.randrange(8), rng.randrange(8)))
+                else:
+                    num_pieces = rng.randint(1, 5)
+                    from_tuple = (rng.randrange(8), rng.randrange(8))
+                    if not self.game.show_pieces(from_tuple):
+                        continue
+                    to_tuple = rng.choice([(from_tuple[0] + num_pieces, from_tuple[1]),
+                                           (from_tuple[0] - num_pieces, from_tuple[1]),
+                                           (from_tuple[0], from_tuple[1] + num_pieces),
+                                           (from_tuple[0], from_tuple[1] - num_pieces)])
+                    self.game.move_piece(player_index, from_tuple, to_tuple, num_pieces)
+                self.assert_features_match()
+
+
+if __name__ == "__main__":
+    unittest.main()